@@ -1,10 +1,15 @@
 import pygame
-import sys
 import random
 import os
+from collections import deque
 
 pygame.init()
 
+# Only QUIT and KEYDOWN are ever handled, so block everything else at the
+# SDL level; mouse motion etc. never even enters the event queue.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
 # Screen dimensions and settings
 WIDTH, HEIGHT = 600, 600
 CELL_SIZE = 20
@@ -13,6 +18,13 @@ pygame.display.set_caption("Enhanced Snake Game")
 clock = pygame.time.Clock()
 SNAKE_SPEED = 15
 
+# Logic runs at SNAKE_SPEED steps per second on a fixed-timestep
+# accumulator; the frame rate is capped separately so slow rendering
+# cannot slow the snake down (or speed it up).
+FPS = 60
+STEP_MS = 1000.0 / SNAKE_SPEED
+MAX_LAG_MS = 4 * STEP_MS  # cap catch-up after a stall
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -22,38 +34,110 @@ RED = (255, 0, 0)
 YELLOW = (255, 255, 0)
 BLUE = (0, 191, 255)
 
-# Fonts
-font_small = pygame.font.SysFont('Arial', 24)
-font_large = pygame.font.SysFont('Arial', 48)
+# Pre-rendered cell tiles - filled once at startup so the draw loop blits
+# a ready surface per cell instead of rasterizing a rectangle each time.
+# convert() matches them to the display pixel format (set_mode has already
+# run above) so each blit is a straight copy, not a per-pixel conversion.
+SNAKE_TILE = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+SNAKE_TILE.fill(GREEN)
+FOOD_TILE = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+FOOD_TILE.fill(RED)
+
+# Fonts - SysFont parses font descriptors and walks the system font list,
+# so each (size, bold) combination is created once and reused.
+_font_cache = {}
+
+def get_font(size, bold=False):
+    key = (size, bold)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.SysFont('Arial', size, bold=bold)
+        _font_cache[key] = font
+    return font
+
+font_small = get_font(24)
+font_large = get_font(48)
+
+# Directions indexed N=0, E=1, S=2, W=3. Opposite directions differ by 2,
+# so the U-turn rejection is a single XOR instead of an opposite table.
+DIRS = ((0, -CELL_SIZE), (CELL_SIZE, 0), (0, CELL_SIZE), (-CELL_SIZE, 0))
+KEY_TO_DIR = {
+    pygame.K_UP: 0,
+    pygame.K_RIGHT: 1,
+    pygame.K_DOWN: 2,
+    pygame.K_LEFT: 3,
+}
 
 # File for best score
 SCORE_FILE = 'best_score.txt'
 
+# Cached best score so the file is parsed once, and the last value known
+# to be on disk so an unchanged score skips the write entirely.
+_best_cache = None
+_last_saved = None
+
 def load_best_score():
-    if os.path.exists(SCORE_FILE):
-        with open(SCORE_FILE, 'r') as file:
-            try:
-                return int(file.read())
-            except:
-                return 0
-    return 0
+    global _best_cache, _last_saved
+    if _best_cache is None:
+        _best_cache = 0
+        if os.path.exists(SCORE_FILE):
+            with open(SCORE_FILE, 'r') as file:
+                try:
+                    _best_cache = int(file.read())
+                    _last_saved = _best_cache
+                except:
+                    pass
+    return _best_cache
 
 def save_best_score(score):
+    global _last_saved
+    if score == _last_saved:
+        return
     with open(SCORE_FILE, 'w') as file:
         file.write(str(score))
+    _last_saved = score
+
+# Rendered-text cache - font rasterization is one of the more expensive
+# SDL_ttf operations and the same strings recur (banners are static,
+# score values repeat across runs), so each render is kept and reused.
+_text_cache = {}
 
 def draw_text(text, font, color, x, y):
-    surface = font.render(text, True, color)
-    screen.blit(surface, (x, y))
+    # Catch calls that skip the font argument (the HUD once passed a color
+    # here, which raised TypeError every frame)
+    assert isinstance(font, pygame.font.Font)
+    key = (text, id(font), color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        _text_cache[key] = surface
+    return screen.blit(surface, (x, y))
 
-def spawn_food(snake_body):
-    while True:
-        x = random.randrange(0, WIDTH, CELL_SIZE)
-        y = random.randrange(0, HEIGHT, CELL_SIZE)
-        if [x, y] not in snake_body:
-            return [x, y]
+def repaint_cells(rect, snake_cells, food_pos):
+    # Restore the background under rect, re-blitting any tiles it overlaps
+    screen.fill(DARK_GREEN, rect)
+    x0 = rect.left - rect.left % CELL_SIZE
+    y0 = rect.top - rect.top % CELL_SIZE
+    for x in range(x0, rect.right, CELL_SIZE):
+        for y in range(y0, rect.bottom, CELL_SIZE):
+            if (x, y) in snake_cells:
+                screen.blit(SNAKE_TILE, (x, y))
+            elif (x, y) == food_pos:
+                screen.blit(FOOD_TILE, (x, y))
+
+# Every cell on the board. The free set is maintained incrementally in
+# main() so food placement is a single random draw; rejection sampling
+# degrades as the snake fills the board.
+ALL_CELLS = [(x, y) for x in range(0, WIDTH, CELL_SIZE)
+             for y in range(0, HEIGHT, CELL_SIZE)]
+
+def spawn_food(free_cells):
+    if not free_cells:
+        return None  # Board is full
+    return random.choice(tuple(free_cells))
 
 def game_over_screen(score, best_score):
+    """Show the game-over screen. Returns True to restart, False to quit."""
     screen.fill(BLACK)
     draw_text("Game Over!", font_large, RED, WIDTH // 2 - 130, HEIGHT // 2 - 100)
     draw_text(f'Your Score: {score}', font_small, WHITE, WIDTH // 2 - 80, HEIGHT // 2 - 50)
@@ -61,114 +145,193 @@ def game_over_screen(score, best_score):
     draw_text("Press R to Restart or Q to Quit", font_small, YELLOW, WIDTH // 2 - 150, HEIGHT // 2 + 20)
     pygame.display.flip()
 
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                save_best_score(best_score)
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    waiting = False
-                elif event.key == pygame.K_q:
-                    save_best_score(best_score)
-                    pygame.quit()
-                    sys.exit()
+    # Nothing on this screen changes, so sleep until the next input
+    # instead of spinning on an empty event queue.
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                return True
+            elif event.key == pygame.K_q:
+                return False
 
 def main():
     best_score = load_best_score()
 
-    # Initialize snake
-    snake_pos = [WIDTH // 2, HEIGHT // 2]
-    snake_body = [snake_pos[:]]
-    direction = [0, -CELL_SIZE]
-    change_to = direction[:]
-    score = 0
-    paused = False
-
-    # Spawn food
-    food_pos = spawn_food(snake_body)
-
-    game_running = True
-
-    while game_running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                save_best_score(best_score)
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP and direction != [0, CELL_SIZE]:
-                    change_to = [0, -CELL_SIZE]
-                elif event.key == pygame.K_DOWN and direction != [0, -CELL_SIZE]:
-                    change_to = [0, CELL_SIZE]
-                elif event.key == pygame.K_LEFT and direction != [CELL_SIZE, 0]:
-                    change_to = [-CELL_SIZE, 0]
-                elif event.key == pygame.K_RIGHT and direction != [-CELL_SIZE, 0]:
-                    change_to = [CELL_SIZE, 0]
-                elif event.key == pygame.K_p:
-                    paused = not paused
-                elif event.key == pygame.K_q:
-                    save_best_score(best_score)
-                    pygame.quit()
-                    sys.exit()
-
-        if paused:
-            draw_text("Paused - Press P to Resume", font_small, YELLOW, WIDTH // 2 - 130, HEIGHT // 2)
-            pygame.display.flip()
-            clock.tick(5)
-            continue
-
-        # Update direction
-        direction = change_to[:]
-
-        # Move snake
-        snake_pos[0] += direction[0]
-        snake_pos[1] += direction[1]
-
-        # Check wall collision
-        if (snake_pos[0] < 0 or snake_pos[0] >= WIDTH or
-            snake_pos[1] < 0 or snake_pos[1] >= HEIGHT):
-            # Game over
-            if score > best_score:
-                best_score = score
-            game_over_screen(score, best_score)
-            main()  # Restart game
-
-        # Check self collision
-        if snake_pos in snake_body[1:]:
-            if score > best_score:
-                best_score = score
-            game_over_screen(score, best_score)
-            main()
-
-        # Update snake body
-        snake_body.insert(0, snake_pos[:])
-        if snake_pos == food_pos:
-            score += 10
-            if score > best_score:
-                best_score = score
-            food_pos = spawn_food(snake_body)
-        else:
-            snake_body.pop()
-
-        # Draw everything
-        screen.fill(DARK_GREEN)
-
-        # Draw snake
-        for pos in snake_body:
-            pygame.draw.rect(screen, GREEN, pygame.Rect(pos[0], pos[1], CELL_SIZE, CELL_SIZE))
-        # Draw food
-        pygame.draw.rect(screen, RED, pygame.Rect(food_pos[0], food_pos[1], CELL_SIZE, CELL_SIZE))
-
-        # Draw scores
-        draw_text(f'Score: {score}', WHITE, 10, 10)
-        draw_text(f'Best: {best_score}', WHITE, 10, 40)
-        draw_text("Press P to Pause", WHITE, WIDTH - 180, 10)
-
-        pygame.display.flip()
-        clock.tick(SNAKE_SPEED)
+    # Bind hot-loop names to locals once: LOAD_FAST in the frame loop
+    # instead of a module attribute lookup per use
+    event_get = pygame.event.get
+    QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+    EVENT_TYPES = (QUIT, KEYDOWN)
+    K_P, K_Q = pygame.K_p, pygame.K_q
+    Rect = pygame.Rect
+    flip = pygame.display.flip
+    update = pygame.display.update
+    blit = screen.blit
+    tick = clock.tick
+
+    # One quit path: every exit condition clears `running` and control
+    # falls through to the save/pygame.quit() at the bottom, instead of
+    # calling sys.exit() mid-loop (which skips normal teardown) or
+    # recursing into main() to restart.
+    running = True
+    while running:
+        # Initialize snake. The body is a deque so pushing the new head is
+        # O(1) (list.insert(0, ...) shifts every element).
+        snake_body = deque([(WIDTH // 2, HEIGHT // 2)])
+        # Set of occupied cells, kept in sync with snake_body so collision
+        # and food-spawn checks are O(1) instead of scanning the whole body.
+        snake_cells = set(snake_body)
+        free_cells = set(ALL_CELLS) - snake_cells
+        direction_idx = 0  # start heading north
+        change_idx = direction_idx
+        score = 0
+        paused = False
+
+        # Spawn food
+        food_pos = spawn_food(free_cells)
+
+        # Last blitted rect of each HUD line, so changed regions can be
+        # restored without repainting the whole frame
+        hud_rects = {}
+        repaint = True
+        crashed = False
+        accumulator = 0.0
+        # Absorb the time spent on the game-over screen, like the pause
+        # branch does, so the first frame of a run doesn't burst steps
+        tick(FPS)
+        while running and not crashed:
+            for event in event_get(EVENT_TYPES):
+                if event.type == QUIT:
+                    running = False
+                elif event.type == KEYDOWN:
+                    new_dir = KEY_TO_DIR.get(event.key)
+                    if new_dir is not None:
+                        if (new_dir ^ direction_idx) != 2:
+                            change_idx = new_dir
+                    elif event.key == K_P:
+                        paused = not paused
+                        if not paused:
+                            # Erase the pause banner
+                            repaint = True
+                    elif event.key == K_Q:
+                        running = False
+            if not running:
+                break
+
+            if paused:
+                draw_text("Paused - Press P to Resume", font_small, YELLOW, WIDTH // 2 - 130, HEIGHT // 2)
+                flip()
+                # Sleep until the next input instead of ticking; the event
+                # is pushed back so the handler at the top of the loop
+                # sees it.
+                pygame.event.post(pygame.event.wait())
+                # Absorb the time spent asleep so steps don't burst on
+                # resume
+                tick(FPS)
+                continue
+
+            # Fixed timestep: frames are paced at FPS, and a snake step
+            # runs each time STEP_MS of real time has accumulated, so the
+            # logic rate stays at SNAKE_SPEED regardless of draw cost.
+            accumulator += tick(FPS)
+            if accumulator > MAX_LAG_MS:
+                accumulator = MAX_LAG_MS
+
+            dirty = []
+            score_before = score
+            while accumulator >= STEP_MS and not crashed:
+                accumulator -= STEP_MS
+
+                # Update direction
+                direction_idx = change_idx
+                dx, dy = DIRS[direction_idx]
+
+                # Move snake
+                hx, hy = snake_body[0]
+                nx = hx + dx
+                ny = hy + dy
+                head = (nx, ny)
+
+                # Check wall and self collision. The wall test ORs the four
+                # signed margins: any out-of-bounds coordinate flips the
+                # sign bit, so one comparison replaces four.
+                if ((nx | ny | (WIDTH - CELL_SIZE - nx) | (HEIGHT - CELL_SIZE - ny)) < 0
+                        or head in snake_cells):
+                    if score > best_score:
+                        best_score = score
+                    crashed = True
+                    break
+
+                # Update snake body
+                snake_body.appendleft(head)
+                snake_cells.add(head)
+                free_cells.discard(head)
+                ate = head == food_pos
+                tail = None
+                if ate:
+                    score += 10
+                    if score > best_score:
+                        best_score = score
+                    food_pos = spawn_food(free_cells)
+                else:
+                    tail = snake_body.pop()
+                    snake_cells.discard(tail)
+                    free_cells.add(tail)
+
+                # Paint this step's cell changes; the display update is
+                # pushed once per frame after all pending steps ran
+                if not repaint:
+                    if tail is not None:
+                        rect = Rect(tail[0], tail[1], CELL_SIZE, CELL_SIZE)
+                        repaint_cells(rect, snake_cells, food_pos)
+                        dirty.append(rect)
+                    dirty.append(blit(SNAKE_TILE, head))
+                    if ate and food_pos is not None:
+                        dirty.append(blit(FOOD_TILE, food_pos))
+
+            if crashed:
+                continue
+
+            # Present. A full repaint happens on new runs and after
+            # unpausing; a normal frame only pushes the dirty rects.
+            if repaint:
+                screen.fill(DARK_GREEN)
+                blit_seq = [(SNAKE_TILE, pos) for pos in snake_body]
+                if food_pos is not None:
+                    blit_seq.append((FOOD_TILE, food_pos))
+                screen.blits(blit_seq, doreturn=False)
+                hud_rects['score'] = draw_text(f'Score: {score}', font_small, WHITE, 10, 10)
+                hud_rects['best'] = draw_text(f'Best: {best_score}', font_small, WHITE, 10, 40)
+                hud_rects['hint'] = draw_text("Press P to Pause", font_small, WHITE, WIDTH - 180, 10)
+                flip()
+                repaint = False
+            elif dirty:
+                # HUD lines whose numbers changed, plus any a changed cell
+                # was painted over, are erased and drawn back on top
+                hud_texts = {'score': f'Score: {score}',
+                             'best': f'Best: {best_score}',
+                             'hint': "Press P to Pause"}
+                stale = {key for key, rect in hud_rects.items()
+                         if rect.collidelist(dirty) != -1}
+                if score != score_before:
+                    stale.update(('score', 'best'))
+                for key in stale:
+                    old = hud_rects[key]
+                    repaint_cells(old, snake_cells, food_pos)
+                    dirty.append(old)
+                    hud_rects[key] = draw_text(hud_texts[key], font_small, WHITE, old.x, old.y)
+                    dirty.append(hud_rects[key])
+
+                update(dirty)
+
+        if crashed:
+            running = game_over_screen(score, best_score)
+
+    save_best_score(best_score)
+    pygame.quit()
 
 if __name__ == '__main__':
     main()